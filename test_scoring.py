@@ -0,0 +1,191 @@
+"""
+Parity tests for the FraudGuard ML scoring engine
+
+The batch scorer (score_batch and the _score_numeric kernel) and the scalar
+calculate_fraud_risk are checked against a plain reference implementation of the
+risk rules, with the random noise switched off. Run with: python -m pytest test_scoring.py
+"""
+import itertools
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import main
+
+
+class _NoNoise:
+    """Stand-in for the engine's random generator that always draws zeros"""
+
+    def uniform(self, low, high, size=None):
+        return np.zeros(size)
+
+
+def reference_risk(transaction):
+    """The per-transaction risk rules as originally written, used as the specification"""
+    risk = 0.0
+    factors = []
+
+    amount = transaction.amount
+    if amount > 50000:
+        risk += 0.4
+        factors.append("Very high transaction amount")
+    elif amount > 10000:
+        risk += 0.3
+        factors.append("High transaction amount")
+    elif amount > 5000:
+        risk += 0.2
+        factors.append("Above average transaction amount")
+    elif amount > 1000:
+        risk += 0.1
+        factors.append("Moderate transaction amount")
+    if amount < 1:
+        risk += 0.2
+        factors.append("Unusually small transaction amount")
+
+    method = transaction.paymentMethod
+    method_risk = {'digital_wallet': 0.25, 'credit_card': 0.15, 'debit_card': 0.1,
+                   'bank_transfer': 0.05, 'cash': 0.0}.get(method, 0.2)
+    risk += method_risk
+    if method_risk > 0.2:
+        factors.append(f"High-risk payment method: {method}")
+    elif method_risk > 0.1:
+        factors.append(f"Medium-risk payment method: {method}")
+
+    email = transaction.customerEmail
+    local = email.split('@')[0]
+    domain = email.split('@')[1].lower()
+    suspicious = ['tempmail.org', '10minutemail.com', 'guerrillamail.com',
+                  'mailinator.com', 'throwaway.email', 'temp-mail.org']
+    if any(s in domain for s in suspicious):
+        risk += 0.4
+        factors.append("Suspicious email domain")
+    if domain in ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']:
+        risk += 0.1
+        factors.append("Free email provider")
+    if len(local) < 3:
+        risk += 0.15
+        factors.append("Very short email username")
+    if len([c for c in local if c.isdigit()]) > 5:
+        risk += 0.1
+        factors.append("Email contains many numbers")
+
+    merchant = transaction.merchantId.upper()
+    if any(c in merchant for c in ['CRYPTO', 'GAMBLING', 'ADULT', 'PHARMACY']):
+        risk += 0.3
+        factors.append("High-risk merchant category")
+    elif any(c in merchant for c in ['ELECTRONICS', 'JEWELRY', 'TRAVEL']):
+        risk += 0.15
+        factors.append("Medium-risk merchant category")
+    if 'NEW' in merchant or 'UNKNOWN' in merchant:
+        risk += 0.2
+        factors.append("New or unknown merchant")
+
+    if transaction.timestamp:
+        try:
+            dt = datetime.fromisoformat(transaction.timestamp.replace('Z', '+00:00'))
+        except ValueError:
+            risk += 0.05
+            factors.append("Invalid timestamp format")
+        else:
+            if dt.hour < 6 or dt.hour > 23:
+                risk += 0.15
+                factors.append("Late night transaction")
+            if dt.weekday() >= 5:
+                risk += 0.05
+                factors.append("Weekend transaction")
+
+    currency = transaction.currency
+    if currency == 'NGN':
+        risk += 0.2
+        factors.append(f"High-risk currency: {currency}")
+    elif currency in ['EUR', 'GBP']:
+        risk += 0.1
+        factors.append(f"Medium-risk currency: {currency}")
+
+    return min(max(risk, 0.0), 1.0), factors
+
+
+AMOUNTS = [0.01, 0.99, 1, 999, 1000, 1000.01, 5000, 5000.5, 10000, 10001, 50000, 50001, float('inf')]
+TIMESTAMPS = [None, "", "2024-01-15T14:30:00Z", "2024-01-15T02:30:00Z", "2024-01-13T23:59:00+01:00",
+              "2024-01-14T05:59:59.123", "2024-01-16", "not-a-date"]
+EMAILS = ["alice.johnson@gmail.com", "user123@tempmail.org", "b@sub.10minutemail.com",
+          "reader1234567@Hotmail.com", "ab@company.com", "x.y.z@outlook.com", "john@example.org"]
+MERCHANTS = ["AMAZON_001", "CRYPTO_EXCHANGE_001", "new_jewelry_store", "unknown_travel",
+             "PHARMACY1", "ELECTRONICS", "coffee_shop", "adult_new"]
+
+
+def _transactions():
+    """Every amount/method/currency/timestamp combination, cycling emails and merchants"""
+    emails = itertools.cycle(EMAILS)
+    merchants = itertools.cycle(MERCHANTS)
+    return [
+        main.Transaction(amount=amount, currency=currency, merchantId=next(merchants),
+                         paymentMethod=method, customerEmail=next(emails), timestamp=timestamp)
+        for amount, method, currency, timestamp in itertools.product(
+            AMOUNTS, main._SUPPORTED_PAYMENT_METHODS, main._SUPPORTED_CURRENCIES, TIMESTAMPS
+        )
+    ]
+
+
+@pytest.fixture
+def engine():
+    engine = main.FraudDetectionEngine()
+    engine._rng = _NoNoise()
+    return engine
+
+
+@pytest.fixture(params=["compiled", "python"])
+def kernel(request, monkeypatch):
+    """Run each test with the numba-compiled kernel and with its pure-Python fallback"""
+    if request.param == "python":
+        monkeypatch.setattr(main, "_score_numeric", getattr(main._score_numeric, "py_func", main._score_numeric))
+        monkeypatch.setattr(main, "_score_amount_time_kernel", main._score_amount_time)
+    return request.param
+
+
+def test_score_batch_matches_reference(engine, kernel):
+    """Batch scores and risk factors match the reference rules for every combination"""
+    transactions = _transactions()
+    for start in range(0, len(transactions), 100):
+        batch = transactions[start:start + 100]
+        risk_scores, risk_factors = engine.score_batch(batch)
+        for transaction, score, factors in zip(batch, risk_scores.tolist(), risk_factors):
+            expected_score, expected_factors = reference_risk(transaction)
+            assert score == pytest.approx(expected_score, abs=1e-9), transaction
+            assert factors == expected_factors, transaction
+
+
+def test_calculate_fraud_risk_matches_reference(engine, monkeypatch):
+    """The single-transaction API applies the same rules as the batch path"""
+    monkeypatch.setattr(main.random, "random", lambda: 0.0)
+    for transaction in _transactions():
+        score, factors = engine.calculate_fraud_risk(transaction)
+        expected_score, expected_factors = reference_risk(transaction)
+        assert score == pytest.approx(expected_score, abs=1e-9), transaction
+        assert factors == expected_factors, transaction
+
+
+def test_infinite_amount_is_very_high(engine, kernel):
+    """+Infinity passes validation and must land in the top amount tier"""
+    request = main.TransactionRequest.model_validate_json(
+        '{"transactions": [{"amount": Infinity, "currency": "USD", "merchantId": "shop",'
+        ' "paymentMethod": "cash", "customerEmail": "alice@example.com"}]}'
+    )
+    _, risk_factors = engine.score_batch(request.transactions)
+    assert risk_factors == [["Very high transaction amount"]]
+
+
+def test_unknown_payment_method_is_named_in_factor(engine):
+    """Value-specific factors are formatted from the transaction when the mask is decoded"""
+    risk, mask = engine._assess_payment_method_risk("voucher")
+    assert risk == 0.2
+    assert main._factors_from_mask(mask, "voucher", "USD") == ["Medium-risk payment method: voucher"]
+
+
+def test_risk_levels(engine):
+    """Batch and scalar risk levels agree at the threshold boundaries"""
+    scores = [0.0, 0.59, 0.6, 0.79, 0.8, 1.0]
+    expected = ['low', 'low', 'medium', 'medium', 'high', 'high']
+    assert engine.get_risk_levels(np.array(scores)) == expected
+    assert [engine.get_risk_level(score) for score in scores] == expected